@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Any, Dict, List
+import numpy as np
 import pandas as pd
 
+from impactproof.standardize.missing_labels import missing_mask
+
 
 @dataclass
 class CompletenessResult:
@@ -41,17 +44,27 @@ def run_completeness(df: pd.DataFrame, cfg: Dict[str, Any]) -> CompletenessResul
             issues=issues,
         )
 
+    if not required_fields or len(df) == 0:
+        return CompletenessResult(
+            check="completeness",
+            status="PASS",
+            completeness_rate=1.0,
+            missing_cells=0,
+            total_required_cells=0,
+            notes="No required fields or no rows",
+            issues=pd.DataFrame(columns=["check", "record_index", "field", "message", "suggested_fix"]),
+        )
+
     # Compute completeness over required cells (row x required_fields)
     required = df[required_fields]
 
     # Treat NA/UNKNOWN as missing; NO is allowed as a real value
-    norm = required.astype(str).apply(lambda s: s.str.strip())
-    is_missing = required.isna() | norm.eq("") | norm.eq("NA") | norm.eq("UNKNOWN")
-    is_present = ~is_missing
+    is_missing = missing_mask(required)
 
-    total_required_cells = int(is_present.size)
-    present_cells = int(is_present.values.sum())
-    missing_cells = total_required_cells - present_cells
+    missing_arr = is_missing.to_numpy()
+    total_required_cells = int(missing_arr.size)
+    missing_cells = int(np.count_nonzero(missing_arr))
+    present_cells = total_required_cells - missing_cells
     completeness_rate = present_cells / total_required_cells if total_required_cells else 0.0
 
     # Status logic
@@ -63,22 +76,16 @@ def run_completeness(df: pd.DataFrame, cfg: Dict[str, Any]) -> CompletenessResul
         status = "FAIL"
 
     # Record-level issues: one row per missing required field per record
-    issues_rows = []
-    missing_tokens = {"", "NA", "UNKNOWN"}
-
-    for idx, row in required.iterrows():
-        for col in required_fields:
-            val = row[col]
-            s = "" if pd.isna(val) else str(val).strip()
-            if pd.isna(val) or s in missing_tokens:
-                issues_rows.append({
-                    "check": "completeness",
-                    "record_index": idx,
-                    "field": col,
-                    "message": f"Missing required value for '{col}'",
-                    "suggested_fix": f"Populate '{col}' or mark explicitly (NA/UNKNOWN) where appropriate.",
-                })
-    issues = pd.DataFrame(issues_rows)
+    # (row-major positions of the missing cells, built column-wise)
+    rows, cols = np.nonzero(missing_arr)
+    field = required.columns[cols].astype(str)
+    issues = pd.DataFrame({
+        "check": "completeness",
+        "record_index": required.index[rows],
+        "field": field,
+        "message": "Missing required value for '" + field + "'",
+        "suggested_fix": "Populate '" + field + "' or mark explicitly (NA/UNKNOWN) where appropriate.",
+    })
 
     notes = f"{completeness_rate:.1%} required cells present ({missing_cells} missing of {total_required_cells})"
     return CompletenessResult(
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 
+from impactproof.standardize.missing_labels import missing_mask
+
 
 @dataclass
 class ConsistencyResult:
@@ -15,15 +18,49 @@ class ConsistencyResult:
     issues: pd.DataFrame
 
 
-def _is_missing(val: Any) -> bool:
-    if val is None or (isinstance(val, float) and pd.isna(val)):
-        return True
-    s = str(val).strip()
-    return s == "" or s in {"NA", "UNKNOWN"}
+@dataclass(frozen=True)
+class CompiledRule:
+    name: str
+    when_field: Optional[str]
+    when_equals: str            # as configured, for messages
+    when_match: str             # stripped value compared against the data
+    then_required: Tuple[str, ...]
+    then_equals: Tuple[Tuple[str, str], ...]  # (field, stripped expected value)
 
 
-def run_consistency(df: pd.DataFrame, cfg: Dict[str, Any]) -> ConsistencyResult:
-    rules: List[Dict[str, Any]] = cfg.get("rules", []) if cfg else []
+def compile_rules(cfg: Dict[str, Any]) -> List[CompiledRule]:
+    """
+    Normalize the configured rules once so run_consistency does no dict
+    lookups or str()/strip() on constants per rule.
+    """
+    compiled = []
+    for rule in (cfg.get("rules", []) if cfg else []):
+        when = rule.get("when", {})
+        when_equals = str(when.get("equals"))
+        compiled.append(CompiledRule(
+            name=rule.get("name", "UnnamedRule"),
+            when_field=when.get("field"),
+            when_equals=when_equals,
+            when_match=when_equals.strip(),
+            then_required=tuple(rule.get("then_required", [])),
+            then_equals=tuple(
+                (field, str(expected).strip())
+                for field, expected in (rule.get("then_equals", {}) or {}).items()
+            ),
+        ))
+    return compiled
+
+
+def run_consistency(
+    df: pd.DataFrame,
+    cfg: Dict[str, Any],
+    rules: Optional[List[CompiledRule]] = None,
+) -> ConsistencyResult:
+    """
+    rules: pre-compiled rules (see compile_rules); compiled from cfg when omitted.
+    """
+    if rules is None:
+        rules = compile_rules(cfg)
 
     if not rules:
         return ConsistencyResult(
@@ -40,12 +77,18 @@ def run_consistency(df: pd.DataFrame, cfg: Dict[str, Any]) -> ConsistencyResult:
     evaluated_rule_names = set()   # WHEN matched at least one row
     rules_with_issues = set()      # produced record-level or config issues
 
-    for rule in rules:
-        name = rule.get("name", "UnnamedRule")
+    # Stripped string view per column, shared by every rule that touches it
+    stripped_cache: Dict[str, pd.Series] = {}
 
-        when = rule.get("when", {})
-        when_field = when.get("field")
-        when_equals = when.get("equals")
+    def _stripped(field: str) -> pd.Series:
+        if field not in stripped_cache:
+            stripped_cache[field] = df[field].astype(str).str.strip()
+        return stripped_cache[field]
+
+    for rule in rules:
+        name = rule.name
+        when_field = rule.when_field
+        when_equals = rule.when_equals
 
         if not when_field or when_field not in df.columns:
             issues_rows.append({
@@ -59,13 +102,14 @@ def run_consistency(df: pd.DataFrame, cfg: Dict[str, Any]) -> ConsistencyResult:
             continue
 
         # Rows where the condition applies
-        mask = df[when_field].astype(str).str.strip().eq(str(when_equals).strip())
-        if mask.any():
+        mask = _stripped(when_field).eq(rule.when_match)
+        positions = np.flatnonzero(mask.to_numpy())
+        if positions.size:
             evaluated_rule_names.add(name)
+        row_labels = df.index.to_numpy()[positions]
 
         # THEN: required fields must be present
-        then_required = rule.get("then_required", [])
-        for req_field in then_required:
+        for req_field in rule.then_required:
             if req_field not in df.columns:
                 issues_rows.append({
                     "check": "consistency",
@@ -77,21 +121,22 @@ def run_consistency(df: pd.DataFrame, cfg: Dict[str, Any]) -> ConsistencyResult:
                 rules_with_issues.add(name)
                 continue
 
-            for idx in df.index[mask]:
-                val = df.at[idx, req_field]
-                if _is_missing(val):
-                    issues_rows.append({
-                        "check": "consistency",
-                        "record_index": int(idx),
-                        "field": req_field,
-                        "message": f"Rule '{name}': '{when_field}' is '{when_equals}' so '{req_field}' is required",
-                        "suggested_fix": f"Populate '{req_field}' for this record, or correct '{when_field}' if misclassified.",
-                    })
-                    rules_with_issues.add(name)
+            bad = missing_mask(df[req_field].iloc[positions]).to_numpy()
+            if bad.any():
+                rules_with_issues.add(name)
+
+            message = f"Rule '{name}': '{when_field}' is '{when_equals}' so '{req_field}' is required"
+            suggested_fix = f"Populate '{req_field}' for this record, or correct '{when_field}' if misclassified."
+            issues_rows.extend({
+                "check": "consistency",
+                "record_index": int(idx),
+                "field": req_field,
+                "message": message,
+                "suggested_fix": suggested_fix,
+            } for idx in row_labels[bad])
 
         # THEN: specific fields must equal given values
-        then_equals = rule.get("then_equals", {}) or {}
-        for field, expected in then_equals.items():
+        for field, exp in rule.then_equals:
             if field not in df.columns:
                 issues_rows.append({
                     "check": "consistency",
@@ -103,18 +148,20 @@ def run_consistency(df: pd.DataFrame, cfg: Dict[str, Any]) -> ConsistencyResult:
                 rules_with_issues.add(name)
                 continue
 
-            for idx in df.index[mask]:
-                actual = "" if pd.isna(df.at[idx, field]) else str(df.at[idx, field]).strip()
-                exp = str(expected).strip()
-                if actual != exp:
-                    issues_rows.append({
-                        "check": "consistency",
-                        "record_index": int(idx),
-                        "field": field,
-                        "message": f"Rule '{name}': expected '{field}' == '{exp}' when '{when_field}' == '{when_equals}' (got '{actual}')",
-                        "suggested_fix": f"Set '{field}' to '{exp}' or correct '{when_field}'.",
-                    })
-                    rules_with_issues.add(name)
+            actual = _stripped(field).iloc[positions].where(df[field].iloc[positions].notna(), "")
+            actual = actual.to_numpy()
+            bad = actual != exp
+            if bad.any():
+                rules_with_issues.add(name)
+
+            suggested_fix = f"Set '{field}' to '{exp}' or correct '{when_field}'."
+            issues_rows.extend({
+                "check": "consistency",
+                "record_index": int(idx),
+                "field": field,
+                "message": f"Rule '{name}': expected '{field}' == '{exp}' when '{when_field}' == '{when_equals}' (got '{got}')",
+                "suggested_fix": suggested_fix,
+            } for idx, got in zip(row_labels[bad], actual[bad]))
 
     issues = pd.DataFrame(issues_rows, columns=["check", "record_index", "field", "message", "suggested_fix"])
 
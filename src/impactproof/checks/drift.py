@@ -1,9 +1,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 import pandas as pd
 
+from impactproof.standardize.missing_labels import MISSING_TOKENS, missing_mask
+
+
+# Common layouts tried against a sample value, most specific first.
+# Only month-first layouts: pandas' per-element fallback (dateutil) reads
+# ambiguous values month-first, so day-first data is left to pandas.
+_DATE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+    "%m-%d-%Y",
+)
+
 
 @dataclass
 class DriftResult:
@@ -17,6 +34,47 @@ class DriftResult:
     issues: pd.DataFrame
 
 
+def _parses(value: str, fmt: str) -> bool:
+    try:
+        datetime.strptime(value, fmt)
+    except ValueError:
+        return False
+    return True
+
+
+def _guess_format(samples: List[str]) -> Optional[str]:
+    # The first value picks the layout (as pandas does); it is only used if
+    # every sampled value fits it, so mixed columns keep pandas' own parsing
+    if not samples:
+        return None
+    fmt = next((f for f in _DATE_FORMATS if _parses(samples[0], f)), None)
+    if fmt and all(_parses(v, fmt) for v in samples[1:]):
+        return fmt
+    return None
+
+
+def _parse_dates(s: pd.Series) -> pd.Series:
+    """
+    Parse with an explicit format sniffed from the data so pandas stays on its
+    vectorized parser. Leading NA/UNKNOWN labels would otherwise defeat its own
+    format inference and push it into per-element parsing. If the format misses
+    any real value beyond the sample, the column is parsed without one.
+    """
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s
+
+    samples = [
+        v.strip() for v in s.dropna().head(32)
+        if isinstance(v, str) and v.strip() and v.strip() not in MISSING_TOKENS
+    ]
+    fmt = _guess_format(samples)
+    if fmt is not None:
+        dates = pd.to_datetime(s, errors="coerce", format=fmt, cache=True)
+        if not (dates.isna() & ~missing_mask(s)).any():
+            return dates
+    return pd.to_datetime(s, errors="coerce", cache=True)
+
+
 def run_drift(df: pd.DataFrame, cfg: Dict[str, Any]) -> DriftResult:
     date_field = cfg.get("date_field")
     period = cfg.get("period", "monthly")
@@ -36,13 +94,36 @@ def run_drift(df: pd.DataFrame, cfg: Dict[str, Any]) -> DriftResult:
             issues=pd.DataFrame(),
         )
 
+    if len(df) == 0:
+        return DriftResult(
+            check="drift",
+            status="PASS",
+            latest_period="N/A",
+            baseline_avg=0,
+            latest_count=0,
+            pct_change=0.0,
+            notes="No rows to evaluate",
+            issues=pd.DataFrame(),
+        )
+
     # Parse dates safely
-    dates = pd.to_datetime(df[date_field], errors="coerce")
+    dates = _parse_dates(df[date_field])
     valid = dates.notna()
-    df2 = df.loc[valid].copy()
-    df2["_period"] = dates[valid].dt.to_period("M" if period == "monthly" else "W")
+    periods = dates[valid].dt.to_period("M" if period == "monthly" else "W")
+
+    counts = periods.value_counts(sort=False).sort_index()
 
-    counts = df2.groupby("_period").size().sort_index()
+    if counts.empty:
+        return DriftResult(
+            check="drift",
+            status="WARN",
+            latest_period="N/A",
+            baseline_avg=0,
+            latest_count=0,
+            pct_change=0.0,
+            notes=f"No valid dates in '{date_field}'; drift skipped",
+            issues=pd.DataFrame(),
+        )
 
     if len(counts) <= baseline_n:
         return DriftResult(
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Any, Dict, List
+import numpy as np
 import pandas as pd
 
 
@@ -16,6 +17,22 @@ class DuplicatesResult:
     issues: pd.DataFrame
 
 
+def _duplicate_mask(df: pd.DataFrame, keys: List[str]) -> pd.Series:
+    """
+    Same result as df.duplicated(subset=keys, keep=False), but built from
+    per-column factorize codes folded into one dense int64 group id, so rows
+    are counted with np.bincount instead of hashing tuples of objects.
+    """
+    group_ids = np.zeros(len(df), dtype=np.int64)
+    for k in keys:
+        codes, uniques = pd.factorize(df[k], sort=False)
+        # +1 shifts the NaN sentinel (-1) to 0; re-factorize keeps ids < len(df)
+        group_ids = pd.factorize(group_ids * (len(uniques) + 1) + (codes + 1), sort=False)[0]
+
+    counts = np.bincount(group_ids)
+    return pd.Series(counts[group_ids] > 1, index=df.index)
+
+
 def run_duplicates(df: pd.DataFrame, cfg: Dict[str, Any]) -> DuplicatesResult:
     keys: List[str] = cfg.get("keys", [])
     pass_thr: float = float(cfg.get("pass_threshold", 0.0))
@@ -41,19 +58,19 @@ def run_duplicates(df: pd.DataFrame, cfg: Dict[str, Any]) -> DuplicatesResult:
         )
 
     total_rows = int(len(df))
-    if total_rows == 0:
+    if not keys or total_rows == 0:
         return DuplicatesResult(
             check="duplicates",
             status="PASS",
             duplicate_rows=0,
-            total_rows=0,
+            total_rows=total_rows,
             duplicate_rate=0.0,
-            notes="No rows to evaluate",
+            notes="No keys configured" if not keys else "No rows to evaluate",
             issues=pd.DataFrame(columns=["check", "record_index", "field", "message", "suggested_fix"]),
         )
 
     # mark duplicates on the key set (keep all duplicates)
-    dup_mask = df.duplicated(subset=keys, keep=False)
+    dup_mask = _duplicate_mask(df, keys)
     dup_rows = int(dup_mask.sum())
     dup_rate = dup_rows / total_rows
 
@@ -65,13 +82,13 @@ def run_duplicates(df: pd.DataFrame, cfg: Dict[str, Any]) -> DuplicatesResult:
         status = "FAIL"
 
     # record-level issues for duplicate rows
-    issues = df.loc[dup_mask, keys].copy()
-    issues["check"] = "duplicates"
-    issues["record_index"] = issues.index
-    issues["field"] = ",".join(keys)
-    issues["message"] = "Duplicate record detected for key combination"
-    issues["suggested_fix"] = "De-duplicate upstream, or adjust keys if the duplication is expected."
-    issues = issues[["check", "record_index", "field", "message", "suggested_fix"]]
+    issues = pd.DataFrame({
+        "check": "duplicates",
+        "record_index": df.index[dup_mask.to_numpy()],
+        "field": ",".join(keys),
+        "message": "Duplicate record detected for key combination",
+        "suggested_fix": "De-duplicate upstream, or adjust keys if the duplication is expected.",
+    })
 
     notes = f"{dup_rate:.1%} duplicate rows on keys {keys} ({dup_rows}/{total_rows})"
     return DuplicatesResult(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import csv
 
@@ -12,30 +13,73 @@ from impactproof.checks.duplicates import run_duplicates
 from impactproof.standardize.missing_labels import apply_missing_labels
 from impactproof.checks.consistency import run_consistency
 from impactproof.checks.drift import run_drift
+from impactproof.reader import read_csv
 
 
-def write_fix_list(issues_df, output_file):
+def _downcast_integers(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Create a grouped fix list from issues_all:
+    Shrink integer columns to the smallest dtype that holds them (lossless).
+    Floats are left at float64 so their string form is unchanged for rules.
+    """
+    for c in df.select_dtypes(include="integer").columns:
+        downcast = "unsigned" if df[c].min() >= 0 else "integer"
+        df[c] = pd.to_numeric(df[c], downcast=downcast)
+    return df
+
+
+def _categorize_low_cardinality(df: pd.DataFrame, max_ratio: float = 0.5) -> pd.DataFrame:
+    """
+    Hold repetitive text columns (status codes, labels, date buckets) as
+    category so duplicate/key hashing works on integer codes.
+    """
+    total_rows = len(df)
+    if total_rows == 0:
+        return df
+
+    for c in df.select_dtypes(include=["object", "string"]).columns:
+        if df[c].nunique(dropna=False) / total_rows < max_ratio:
+            df[c] = df[c].astype("category")
+    return df
+
+
+ISSUE_COLUMNS = ["check", "record_index", "field", "message", "suggested_fix"]
+
+
+def write_fix_list(issues_frames, output_file):
+    """
+    Create a grouped fix list from the per-check issue frames:
     Groups by (check, field, message), counts affected records.
     """
     import pandas as pd
 
-    if issues_df is None or issues_df.empty:
-        pd.DataFrame(columns=["check", "field", "message", "count"]).to_csv(output_file, index=False)
-        return
+    counts = []
+    for issues_df in issues_frames:
+        if issues_df is None or issues_df.empty:
+            continue
+        df = issues_df.copy()
 
-    df = issues_df.copy()
+        # Normalize missing fields
+        if "field" not in df.columns:
+            df["field"] = ""
+        if "message" not in df.columns:
+            df["message"] = ""
 
-    # Normalize missing fields
-    if "field" not in df.columns:
-        df["field"] = ""
-    if "message" not in df.columns:
-        df["message"] = ""
+        # Few distinct values repeated per row: group on category codes
+        for c in ("check", "field", "message"):
+            df[c] = df[c].astype("category")
+
+        counts.append(
+            df.groupby(["check", "field", "message"], dropna=False, observed=True, sort=False).size()
+        )
+
+    if not counts:
+        pd.DataFrame(columns=["check", "field", "message", "count"]).to_csv(output_file, index=False)
+        return
 
     fix = (
-        df.groupby(["check", "field", "message"], dropna=False)
-          .size()
+        pd.concat(counts)
+          .groupby(level=["check", "field", "message"], dropna=False, observed=True)
+          .sum()
           .reset_index(name="count")
           .sort_values(["count", "check", "field"], ascending=[False, True, True])
     )
@@ -54,16 +98,28 @@ def cmd_run(args: argparse.Namespace) -> int:
     # Load CSV
     csv_file = cfg.input_csv_file
     print(f"Reading CSV: {csv_file}")
-    df = pd.read_csv(csv_file)
+    # Only materialize columns the checks read; configured columns absent
+    # from the file are left for the checks to report.
+    header = pd.read_csv(csv_file, nrows=0).columns
+    usecols = [c for c in header if c in cfg.referenced_fields] or None
+    df = _downcast_integers(read_csv(csv_file, usecols))
 
     # Standardize missing labels (NA/NO/UNKNOWN) before checks
     df = apply_missing_labels(df, cfg.standardization_cfg)
-
-    # Run Checks
-    comp = run_completeness(df, cfg.completeness_cfg)
-    dups = run_duplicates(df, cfg.duplicates_cfg)
-    cons = run_consistency(df, cfg.consistency_cfg)
-    drift = run_drift(df, cfg.drift_cfg)
+    df = _categorize_low_cardinality(df)
+
+    # Run Checks (independent reads of the same frame, so run them concurrently)
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futures = {
+            "comp": ex.submit(run_completeness, df, cfg.completeness_cfg),
+            "dups": ex.submit(run_duplicates, df, cfg.duplicates_cfg),
+            "cons": ex.submit(run_consistency, df, cfg.consistency_cfg, cfg.consistency_rules),
+            "drift": ex.submit(run_drift, df, cfg.drift_cfg),
+        }
+    comp = futures["comp"].result()
+    dups = futures["dups"].result()
+    cons = futures["cons"].result()
+    drift = futures["drift"].result()
 
     # Write scorecard (one row per check + overall)
     scorecard_file = output_dir / "quality_scorecard.csv"
@@ -84,27 +140,18 @@ def cmd_run(args: argparse.Namespace) -> int:
         writer.writeheader()
         writer.writerows(rows)
 
-    # Combine issues
+    # Write issues one check at a time (shared schema) instead of holding a
+    # concatenated copy of every issue in memory
     issues_file = output_dir / "issues_all.csv"
-    all_issues = []
-    if not comp.issues.empty:
-        all_issues.append(comp.issues)
-    if not dups.issues.empty:
-        all_issues.append(dups.issues)
-    if not cons.issues.empty:
-        all_issues.append(cons.issues)
-    if not drift.issues.empty:
-        all_issues.append(drift.issues)
-
-    if all_issues:
-        issues_combined = pd.concat(all_issues, ignore_index=True)
-        issues_combined.to_csv(issues_file, index=False)
-    else:
-        issues_combined = pd.DataFrame(columns=["check", "record_index", "field", "message", "suggested_fix"])
-        issues_combined.to_csv(issues_file, index=False)
+    all_issues = [r.issues for r in (comp, dups, cons, drift) if not r.issues.empty]
+
+    with issues_file.open("w", newline="", encoding="utf-8") as f:
+        pd.DataFrame(columns=ISSUE_COLUMNS).to_csv(f, index=False)
+        for issues in all_issues:
+            issues.reindex(columns=ISSUE_COLUMNS).to_csv(f, header=False, index=False)
 
     fix_list_file = output_dir / "fix_list.csv"
-    write_fix_list(issues_combined, fix_list_file)
+    write_fix_list(all_issues, fix_list_file)
     print(f"Wrote: {fix_list_file}")
 
     print(f"Wrote: {scorecard_file}")
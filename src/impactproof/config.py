@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 import yaml
 
+from impactproof.checks.consistency import CompiledRule, compile_rules
+
 
 @dataclass
 class ImpactProofConfig:
@@ -42,6 +45,23 @@ class ImpactProofConfig:
     def drift_cfg(self) -> dict:
         return self.raw.get("checks", {}).get("drift", {})
 
+    @cached_property
+    def consistency_rules(self) -> List[CompiledRule]:
+        return compile_rules(self.consistency_cfg)
+
+    @property
+    def referenced_fields(self) -> set:
+        """Columns read by at least one configured check."""
+        fields = set(self.completeness_cfg.get("required_fields", []))
+        fields |= set(self.duplicates_cfg.get("keys", []))
+        fields.add(self.drift_cfg.get("date_field"))
+        for rule in self.consistency_rules:
+            fields.add(rule.when_field)
+            fields |= set(rule.then_required)
+            fields |= {field for field, _ in rule.then_equals}
+        fields.discard(None)
+        return fields
+
 
 def load_config(path: str | Path) -> ImpactProofConfig:
     path = Path(path)
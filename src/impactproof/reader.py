@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from io import BytesIO
+from pathlib import Path
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # optional: the C parser alone still works
+    pa = None
+
+
+CsvSource = Union[str, Path, bytes]
+
+
+def _open(source: CsvSource):
+    # Bytes (e.g. a UI upload) get a fresh buffer per read; paths pass through
+    return BytesIO(source) if isinstance(source, bytes) else source
+
+
+# Past this, float64 no longer holds every integer exactly
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+
+
+def _same_as_c_parser(s: pd.Series) -> bool:
+    # Arrow column types the C parser would also produce for this column
+    t = s.dtype.pyarrow_dtype
+    if pa.types.is_string(t) or pa.types.is_large_string(t):
+        return True
+    if pa.types.is_integer(t):
+        # with blanks the C parser gives float64
+        return not s.isna().any()
+    if pa.types.is_floating(t):
+        # integers past int64 came back as lossy doubles; the C parser keeps uint64
+        v = s.dropna().to_numpy(dtype="float64")
+        return not ((np.abs(v) >= _MAX_EXACT_FLOAT_INT).any() and (v == np.floor(v)).all())
+    # dates, timestamps, times, booleans, all-blank (null) columns, ...
+    return False
+
+
+def match_c_parser_types(df: pd.DataFrame, source: CsvSource) -> pd.DataFrame:
+    """
+    Re-read with the C parser every column whose Arrow-inferred type differs
+    from what it would give (dates/times/timestamps stay the file's text,
+    booleans with blanks stay object, all-blank columns are float NaN, ...),
+    so labels and rule comparisons see the same values. Float columns keep
+    their Arrow type: a blank there is <NA> rather than nan when stringified,
+    which only a rule matching the literal text "nan" could notice.
+    """
+    redo = [c for c in df.columns if not _same_as_c_parser(df[c])]
+    if redo:
+        c_df = pd.read_csv(_open(source), usecols=redo)
+        for c in redo:
+            df[c] = c_df[c]
+    return df
+
+
+def read_csv(source: CsvSource, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Parse the input with pandas' pyarrow engine (multithreaded Arrow parser,
+    Arrow-backed columns). Falls back to the default C parser when pyarrow is
+    not installed, or when Arrow rejects input the C parser accepts (e.g. rows
+    with missing trailing fields, which the C parser pads with NaN).
+    """
+    if pa is None:
+        return pd.read_csv(_open(source), usecols=usecols)
+
+    try:
+        df = pd.read_csv(_open(source), usecols=usecols, engine="pyarrow", dtype_backend="pyarrow")
+    except ValueError:
+        # pandas' ParserError and pyarrow's ArrowInvalid both subclass ValueError
+        return pd.read_csv(_open(source), usecols=usecols)
+    return match_c_parser_types(df, source)
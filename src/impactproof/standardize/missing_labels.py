@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable
+import numpy as np
 import pandas as pd
 
 
-def _to_set(values: List[Any]) -> set:
-    # normalize strings, keep None as None
+# Explicit labels that still count as "no usable value" for the checks.
+# NO is a real answer and is deliberately not in this set.
+MISSING_TOKENS = frozenset({"NA", "UNKNOWN"})
+
+
+def _to_set(values: Iterable[Any]) -> set:
+    # normalize strings, keep None as None; any iterable (list, set, frozenset)
     out = set()
     for v in values:
         if v is None:
@@ -17,6 +23,68 @@ def _to_set(values: List[Any]) -> set:
     return out
 
 
+def _label_map(na_values: set, no_values: set, unknown_values: set) -> Dict[Any, str]:
+    """
+    Collapse the ordered relabelling (1) UNKNOWN, (2) NO, (3) NA into a single
+    lookup table. Each pass also sees labels assigned by the earlier passes,
+    so every value ends up with the same label as applying them in sequence.
+    """
+    label_map: Dict[Any, str] = {}
+    for values, label in ((unknown_values, "UNKNOWN"), (no_values, "NO"), (na_values, "NA")):
+        for k, current in label_map.items():
+            if current in values:
+                label_map[k] = label
+        for v in values:
+            label_map.setdefault(v, label)
+    return label_map
+
+
+def build_label_map(ml: Dict[str, Any]) -> Dict[Any, str]:
+    """
+    Pre-build the value -> label table for a missing_labels config block.
+    Callers that build configs repeatedly can store it under
+    standardization.missing_labels_map so apply_missing_labels reuses it.
+    """
+    return _label_map(
+        _to_set(ml.get("na_values", [])),
+        _to_set(ml.get("no_values", [])),
+        _to_set(ml.get("unknown_values", [])),
+    )
+
+
+def _column_missing(s: pd.Series) -> np.ndarray:
+    # Per column, on the stripped values as Python/Arrow strings: a single
+    # fixed-width unicode array would be sized by the longest cell
+    missing = s.isna().to_numpy(dtype=bool)
+    blank_or_token = ["", *MISSING_TOKENS]
+
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        # test each category once, then index by code (-1, null, hits the False pad)
+        hit = np.append(s.cat.categories.astype(str).str.strip().isin(blank_or_token), False)
+        return missing | hit[s.cat.codes.to_numpy()]
+    if s.dtype == "object":
+        text = s.astype(str).str.strip()
+    elif pd.api.types.is_string_dtype(s.dtype):
+        text = s.str.strip()
+    else:
+        # numeric/datetime/bool values are never blank or a token
+        return missing
+    return missing | text.isin(blank_or_token).fillna(False).to_numpy(dtype=bool)
+
+
+def missing_mask(values: pd.Series | pd.DataFrame) -> pd.Series | pd.DataFrame:
+    """
+    Boolean mask of cells that are null, blank, or one of MISSING_TOKENS.
+    Works on a Series or a whole DataFrame, one column at a time.
+    """
+    if isinstance(values, pd.DataFrame):
+        return pd.DataFrame(
+            {i: _column_missing(values.iloc[:, i]) for i in range(values.shape[1])},
+            index=values.index,
+        ).set_axis(values.columns, axis=1)
+    return pd.Series(_column_missing(values), index=values.index, name=values.name)
+
+
 def apply_missing_labels(df: pd.DataFrame, cfg: Dict[str, Any]) -> pd.DataFrame:
     """
     Standardize missing-like values into explicit labels:
@@ -28,31 +96,34 @@ def apply_missing_labels(df: pd.DataFrame, cfg: Dict[str, Any]) -> pd.DataFrame:
     - We do NOT convert everything to strings.
     - We only operate on object/string columns by default to avoid breaking numeric fields.
     """
-    ml = cfg.get("missing_labels", {}) if cfg else {}
-    na_values = _to_set(ml.get("na_values", []))
-    no_values = _to_set(ml.get("no_values", []))
-    unknown_values = _to_set(ml.get("unknown_values", []))
+    cfg = cfg or {}
+    label_map = cfg.get("missing_labels_map")
+    if label_map is None:
+        label_map = build_label_map(cfg.get("missing_labels", {}))
 
     df2 = df.copy()
 
-    # Only clean object columns (safe for MVP)
-    obj_cols = [c for c in df2.columns if df2[c].dtype == "object"]
+    # Only clean text columns: object or pandas string dtype (safe for MVP)
+    obj_cols = list(df2.select_dtypes(include=["object", "string"]).columns)
 
     for col in obj_cols:
         s = df2[col]
 
-        # Normalize whitespace-only to empty string
-        s = s.apply(lambda x: x.strip() if isinstance(x, str) else x)
+        # Normalize whitespace-only to empty string; other non-object
+        # columns (e.g. Arrow null-typed, all blank) have no text to clean
+        if s.dtype == "object":
+            s = s.apply(lambda x: x.strip() if isinstance(x, str) else x)
+        elif pd.api.types.is_string_dtype(s.dtype):
+            s = s.str.strip()
+        else:
+            continue
         s = s.fillna("NA")
 
-        # Apply mappings in a stable order
-        # 1) UNKNOWN
-        s = s.apply(lambda x: "UNKNOWN" if (x in unknown_values) else x)
-        # 2) NO
-        s = s.apply(lambda x: "NO" if (x in no_values) else x)
-        # 3) NA (includes blanks/None if configured)
-        s = s.apply(lambda x: "NA" if (x in na_values) else x)
+        # Apply all mappings in one hash-lookup pass; unmapped values are kept
+        mapped = s.map(label_map).fillna(s)
+        if s.dtype != "object":
+            mapped = mapped.astype(s.dtype)
 
-        df2[col] = s
+        df2[col] = mapped
 
     return df2
\ No newline at end of file
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from impactproof.reader import read_csv
+
+pytest.importorskip("pyarrow")
+
+
+def test_read_csv_matches_c_parser_text(tmp_path):
+    path = tmp_path / "in.csv"
+    path.write_text("id,visit,seen_at,blank\n1,2026-01-05,2026-01-05 10:00,\n2,NA,,\n")
+
+    df = read_csv(path)
+    # dates stay as the file's text (nulls still null), blank columns are NaN
+    assert df["visit"].tolist()[0] == "2026-01-05"
+    assert pd.isna(df["visit"].tolist()[1])
+    assert df["seen_at"].tolist()[0] == "2026-01-05 10:00"
+    assert df["blank"].dtype == "float64"
+
+
+def test_read_csv_header_only(tmp_path):
+    path = tmp_path / "in.csv"
+    path.write_text("id,visit\n")
+    assert read_csv(path).empty
+
+
+def test_read_csv_short_rows_fall_back_to_c_parser(tmp_path):
+    path = tmp_path / "in.csv"
+    path.write_text("a,b,c\n1,2,3\n4,5\n")
+    df = read_csv(path)
+    assert len(df) == 2
+    assert pd.isna(df["c"].tolist()[1])
+
+
+def test_read_csv_restores_c_parser_types(tmp_path):
+    path = tmp_path / "in.csv"
+    path.write_text(
+        "visit_time,flag,big_id,count\n"
+        "10:00,True,12345678901234567890,1\n"
+        ",,2,\n"
+        "09:30,False,3,3\n"
+    )
+    df = read_csv(path)
+    expected = pd.read_csv(path)
+    for c in expected.columns:
+        assert df[c].dtype == expected[c].dtype, c
+        assert [str(v) for v in df[c]] == [str(v) for v in expected[c]], c
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import warnings
+
+import pandas as pd
+
+from impactproof.checks.drift import _parse_dates
+
+
+def _baseline(s: pd.Series) -> pd.Series:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return pd.to_datetime(s, errors="coerce")
+
+
+def test_format_mismatch_falls_back_to_pandas():
+    for values in (
+        ["NA", "05/01/2026", "13/01/2026"],   # fits neither layout alone
+        ["NA", "2026-01-05", "3/4/2026"],     # mixed layouts
+        ["NA"] + ["01/02/2026"] * 40 + ["25/02/2026"],  # misfit past the sample
+    ):
+        s = pd.Series(values, dtype=object)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            got = _parse_dates(s)
+        assert got.equals(_baseline(s))
+
+
+def test_consistent_format_uses_fast_path():
+    s = pd.Series(["NA", "2026-01-05", "2026-02-10", "UNKNOWN"], dtype=object)
+    assert _parse_dates(s).equals(_baseline(s))
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from impactproof.checks.duplicates import run_duplicates
+
+
+def test_no_keys_reports_row_count():
+    df = pd.DataFrame({"id": ["a", "a", "b"]})
+    res = run_duplicates(df, {"keys": []})
+    assert res.status == "PASS"
+    assert res.total_rows == 3
+    assert res.duplicate_rows == 0
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from impactproof.standardize.missing_labels import apply_missing_labels, missing_mask
+
+pa = pytest.importorskip("pyarrow")
+
+
+CFG = {"missing_labels": {"na_values": ["", "N/A", None], "no_values": ["no"], "unknown_values": ["Not sure"]}}
+
+
+def test_null_typed_column_is_left_alone():
+    df = pd.DataFrame({
+        "blank": pd.Series([None, None], dtype=pd.ArrowDtype(pa.null())),
+        "text": pd.Series([" no ", None], dtype="string[pyarrow]"),
+    })
+    out = apply_missing_labels(df, CFG)
+    assert out["blank"].isna().all()
+    assert out["text"].tolist() == ["NO", "NA"]
+
+
+def test_header_only_arrow_frame():
+    df = pd.DataFrame({"a": pd.Series([], dtype=pd.ArrowDtype(pa.null()))})
+    assert apply_missing_labels(df, CFG).empty
+
+
+def test_missing_mask_per_dtype():
+    values = [" NA ", "", None, "x", "UNKNOWN", "y" * 2000]
+    expected = [True, True, True, False, True, False]
+    df = pd.DataFrame({
+        "obj": pd.Series(values, dtype=object),
+        "arrow": pd.Series(values, dtype="string[pyarrow]"),
+        "cat": pd.Series(values, dtype=object).astype("category"),
+    })
+    mask = missing_mask(df)
+    for c in df.columns:
+        assert mask[c].tolist() == expected
+    assert missing_mask(pd.Series([1.0, None, 0.0])).tolist() == [False, True, False]
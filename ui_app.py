@@ -1,20 +1,32 @@
 from __future__ import annotations
 
+import hashlib
 import io
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
 import streamlit as st
 
-from impactproof.standardize.missing_labels import apply_missing_labels
+from impactproof.reader import read_csv
+from impactproof.standardize.missing_labels import apply_missing_labels, build_label_map
 from impactproof.checks.completeness import run_completeness
 from impactproof.checks.duplicates import run_duplicates
-from impactproof.checks.consistency import run_consistency
+from impactproof.checks.consistency import compile_rules, run_consistency
 from impactproof.checks.drift import run_drift
 
 
+ISSUES_PREVIEW_ROWS = 1000
+# Below this many rows thread start-up costs more than the checks themselves
+PARALLEL_MIN_ROWS = 50_000
+# Cached frames/results are per process and shared by all sessions; keep
+# only the last few upload/config combinations
+CACHE_MAX_ENTRIES = 4
+RULE_COLUMNS = ["name", "when_field", "when_equals", "then_required", "then_equals_field", "then_equals_value"]
+
 st.set_page_config(page_title="ImpactProof Pilot UI", layout="wide")
 st.title("ImpactProof — Pilot v0.5.0")
 st.caption("Upload a CSV, configure checks, run, and review outputs.")
@@ -24,17 +36,90 @@ st.caption("Upload a CSV, configure checks, run, and review outputs.")
 # Helpers
 # ---------------------------
 def to_csv_bytes(df: pd.DataFrame) -> bytes:
-    return df.to_csv(index=False).encode("utf-8")
+    # Write UTF-8 straight into a binary buffer instead of building a str first
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding="utf-8")
+    return buf.getvalue()
 
 
-def build_zip(outputs: dict[str, bytes]) -> bytes:
+def build_zip(outputs: dict[str, bytes], compress: bool = True) -> bytes:
     buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
+    # Level 1: several times faster than the default 6, little size cost on CSV text;
+    # ZIP_STORED skips compression entirely for the fastest build
+    method = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with zipfile.ZipFile(buf, "w", method, compresslevel=1 if compress else None) as z:
         for name, content in outputs.items():
             z.writestr(name, content)
     return buf.getvalue()
 
 
+def _load_csv(data: bytes) -> pa.Table:
+    # Same reader as the CLI, so both see the C parser's column types
+    return pa.Table.from_pandas(read_csv(data), preserve_index=False)
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _encode_outputs(
+    _scorecard_df: pd.DataFrame,
+    _fix_list: pd.DataFrame,
+    _issues_all: pd.DataFrame,
+    run_key: tuple,
+    compress: bool = True,
+) -> tuple[dict[str, bytes], bytes]:
+    outputs = {
+        "quality_scorecard.csv": to_csv_bytes(_scorecard_df),
+        "fix_list.csv": to_csv_bytes(_fix_list),
+        "issues_all.csv": to_csv_bytes(_issues_all),
+    }
+    return outputs, build_zip(outputs, compress)
+
+
+# Standardization and checks are deterministic in (upload, sub-config), so
+# download clicks and other reruns after Run reuse the cached results. Frames
+# are passed unhashed (leading underscore) and the cache is keyed on the upload
+# digest instead: Streamlit hashes only a row sample of large frames, which
+# would hand a corrected re-upload the previous file's results.
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _std(_df: pd.DataFrame, upload_key: str, scfg: dict) -> pd.DataFrame:
+    return apply_missing_labels(_df, scfg)
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _comp(_df: pd.DataFrame, std_key: tuple, ccfg: dict):
+    return run_completeness(_df, ccfg)
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _dups(_df: pd.DataFrame, std_key: tuple, ccfg: dict):
+    return run_duplicates(_df, ccfg)
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _cons(_df: pd.DataFrame, std_key: tuple, ccfg: dict):
+    return run_consistency(_df, ccfg)
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _drift(_df: pd.DataFrame, std_key: tuple, ccfg: dict):
+    return run_drift(_df, ccfg)
+
+
+def narrow(df: pd.DataFrame, fields) -> pd.DataFrame:
+    # Only the columns a check reads (in file order); configured names that
+    # are absent are left for the check itself to report
+    wanted = set(fields)
+    return df[[c for c in df.columns if c in wanted]]
+
+
+def rule_fields(ccfg: dict) -> set:
+    fields = set()
+    for r in compile_rules(ccfg):
+        fields.add(r.when_field)
+        fields.update(r.then_required)
+        fields.update(f for f, _ in r.then_equals)
+    return fields
+
+
 def safe_list(cols) -> list[str]:
     return list(cols) if cols is not None else []
 
@@ -47,7 +132,18 @@ if not uploaded:
     st.info("Upload a CSV to begin.")
     st.stop()
 
-df = pd.read_csv(uploaded)
+# Parse once per upload and keep the Arrow table; later reruns only wrap it
+# (no re-hashing of the upload bytes, no re-parsing)
+if st.session_state.get("upload_id") != uploaded.file_id:
+    raw = uploaded.getvalue()
+    st.session_state["arrow_table"] = _load_csv(raw)
+    st.session_state["upload_key"] = hashlib.sha256(raw).hexdigest()
+    st.session_state["upload_id"] = uploaded.file_id
+# Booleans use pandas' default conversion: with blanks that is object, as the
+# C parser reads them, rather than bool[pyarrow]
+df = st.session_state["arrow_table"].to_pandas(
+    types_mapper=lambda t: None if pa.types.is_boolean(t) else pd.ArrowDtype(t)
+)
 cols = safe_list(df.columns)
 
 st.subheader("Preview")
@@ -58,69 +154,67 @@ st.dataframe(df.head(20), use_container_width=True)
 # ---------------------------
 st.subheader("Configuration")
 
-c1, c2, c3 = st.columns(3)
-with c1:
-    entity_id = st.selectbox("Entity ID field (recommended)", options=["(none)"] + cols, index=0)
-with c2:
-    date_field = st.selectbox("Date field (required for drift)", options=["(none)"] + cols, index=0)
-with c3:
-    required_fields = st.multiselect("Required fields (completeness)", options=cols, default=[])
-
-st.markdown("### Missing value standardization (NA / NO / UNKNOWN)")
-na_values = st.text_input("NA values (comma-separated)", value=", ,N/A,NA,na,n/a")
-no_values = st.text_input("NO values (comma-separated)", value="NO,No,no,FALSE,False,false,0")
-unknown_values = st.text_input("UNKNOWN values (comma-separated)", value="UNKNOWN,Unknown,unknown,Not sure,NOT_SURE")
-
-st.markdown("### Duplicates")
-dup_keys_default = []
-if entity_id != "(none)":
-    dup_keys_default.append(entity_id)
-if date_field != "(none)" and date_field not in dup_keys_default:
-    dup_keys_default.append(date_field)
-
-dup_keys = st.multiselect("Duplicate keys", options=cols, default=dup_keys_default)
-dup_warn = st.number_input("Duplicates WARN threshold (rate)", min_value=0.0, max_value=1.0, value=0.02, step=0.01)
-dup_fail = st.number_input("Duplicates FAIL threshold (rate) — optional", min_value=0.0, max_value=1.0, value=0.10, step=0.01)
-
-st.markdown("### Consistency rules (simple when/then)")
-st.caption("Define rules like: IF field == value THEN required fields must be present; or THEN another field must equal a value.")
-
-if "rules" not in st.session_state:
-    st.session_state.rules = []
-
-add_rule = st.button("➕ Add consistency rule")
-if add_rule:
-    st.session_state.rules.append({
-        "name": f"Rule{len(st.session_state.rules)+1}",
-        "when_field": cols[0] if cols else "",
-        "when_equals": "",
-        "then_required": [],
-        "then_equals_field": "",
-        "then_equals_value": "",
-    })
-
-for i, r in enumerate(st.session_state.rules):
-    with st.expander(f"Rule {i+1}: {r['name']}", expanded=True):
-        r["name"] = st.text_input("Rule name", value=r["name"], key=f"rname{i}")
-        r["when_field"] = st.selectbox("WHEN field", options=cols, index=cols.index(r["when_field"]) if r["when_field"] in cols else 0, key=f"whenf{i}")
-        r["when_equals"] = st.text_input("WHEN equals", value=r["when_equals"], key=f"whene{i}")
-
-        r["then_required"] = st.multiselect("THEN required fields", options=cols, default=r["then_required"], key=f"thenreq{i}")
-
-        st.markdown("Optional THEN equals constraint")
-        r["then_equals_field"] = st.selectbox("Field", options=["(none)"] + cols, index=0, key=f"theneqf{i}")
-        r["then_equals_value"] = st.text_input("Expected value", value=r["then_equals_value"], key=f"theneqv{i}")
-
-        remove = st.button("Remove this rule", key=f"remove{i}")
-        if remove:
-            st.session_state.rules.pop(i)
-            st.rerun()
-
-st.markdown("### Drift")
-drift_period = st.selectbox("Period", options=["monthly", "weekly"], index=0)
-baseline_periods = st.number_input("Baseline periods", min_value=1, max_value=12, value=2, step=1)
-warn_pct = st.number_input("WARN % change (absolute)", min_value=0.0, max_value=1.0, value=0.30, step=0.05)
-fail_pct = st.number_input("FAIL % change (absolute)", min_value=0.0, max_value=1.0, value=0.50, step=0.05)
+# Everything is batched in a form, so edits only rerun on submit
+with st.form("cfg_form"):
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        entity_id = st.selectbox("Entity ID field (recommended)", options=["(none)"] + cols, index=0)
+    with c2:
+        date_field = st.selectbox("Date field (required for drift)", options=["(none)"] + cols, index=0)
+    with c3:
+        required_fields = st.multiselect("Required fields (completeness)", options=cols, default=[])
+
+    st.markdown("### Missing value standardization (NA / NO / UNKNOWN)")
+    na_values = st.text_input("NA values (comma-separated)", value=", ,N/A,NA,na,n/a")
+    no_values = st.text_input("NO values (comma-separated)", value="NO,No,no,FALSE,False,false,0")
+    unknown_values = st.text_input("UNKNOWN values (comma-separated)", value="UNKNOWN,Unknown,unknown,Not sure,NOT_SURE")
+
+    st.markdown("### Duplicates")
+    dup_keys_default = []
+    if entity_id != "(none)":
+        dup_keys_default.append(entity_id)
+    if date_field != "(none)" and date_field not in dup_keys_default:
+        dup_keys_default.append(date_field)
+
+    # Inside the form the entity/date picks only land on submit, so an empty
+    # selection falls back to them instead of re-defaulting the widget
+    dup_keys = st.multiselect(
+        "Duplicate keys",
+        options=cols,
+        key="dup_keys",
+        help="Leave empty to use the entity ID and date fields.",
+    ) or dup_keys_default
+    dup_warn = st.number_input("Duplicates WARN threshold (rate)", min_value=0.0, max_value=1.0, value=0.02, step=0.01)
+    dup_fail = st.number_input("Duplicates FAIL threshold (rate) — optional", min_value=0.0, max_value=1.0, value=0.10, step=0.01)
+
+    st.markdown("### Consistency rules (simple when/then)")
+    st.caption("Define rules like: IF field == value THEN required fields must be present; or THEN another field must equal a value.")
+
+    # One row per rule; the editor's own add/delete controls replace the
+    # per-rule widgets and keep their state across reruns under its key
+    rules_editor = st.data_editor(
+        pd.DataFrame(columns=RULE_COLUMNS),
+        num_rows="dynamic",
+        hide_index=True,
+        key="rules_editor",
+        column_config={
+            "name": st.column_config.TextColumn("Rule name"),
+            "when_field": st.column_config.SelectboxColumn("WHEN field", options=cols),
+            "when_equals": st.column_config.TextColumn("WHEN equals"),
+            "then_required": st.column_config.TextColumn("THEN required fields (comma-separated)"),
+            "then_equals_field": st.column_config.SelectboxColumn("THEN equals field (optional)", options=cols),
+            "then_equals_value": st.column_config.TextColumn("Expected value"),
+        },
+    )
+    rule_rows = rules_editor.to_dict("records")
+
+    st.markdown("### Drift")
+    drift_period = st.selectbox("Period", options=["monthly", "weekly"], index=0)
+    baseline_periods = st.number_input("Baseline periods", min_value=1, max_value=12, value=2, step=1)
+    warn_pct = st.number_input("WARN % change (absolute)", min_value=0.0, max_value=1.0, value=0.30, step=0.05)
+    fail_pct = st.number_input("FAIL % change (absolute)", min_value=0.0, max_value=1.0, value=0.50, step=0.05)
+
+    submitted = st.form_submit_button("▶ Run checks", type="primary")
 
 st.markdown("---")
 
@@ -128,40 +222,39 @@ st.markdown("---")
 # Build config dict
 # ---------------------------
 def parse_list(s: str) -> list[str]:
-    # keep empty string token if user includes it
-    items = [x.strip() for x in s.split(",")]
-    # Remove duplicates but preserve order
-    seen = set()
-    out = []
-    for x in items:
-        if x not in seen:
-            seen.add(x)
-            out.append(x)
-    return out
+    # keep empty string token if user includes it;
+    # dict.fromkeys removes duplicates but preserves order
+    return list(dict.fromkeys(x.strip() for x in s.split(",")))
 
 
 def build_cfg() -> dict:
     rules = []
-    for r in st.session_state.rules:
+    for i, r in enumerate(rule_rows):
         rule = {
-            "name": r["name"],
-            "when": {"field": r["when_field"], "equals": r["when_equals"]},
+            "name": r["name"] or f"Rule{i+1}",
+            "when": {"field": r["when_field"] or "", "equals": r["when_equals"] or ""},
         }
-        if r["then_required"]:
-            rule["then_required"] = r["then_required"]
-        if r["then_equals_field"] and r["then_equals_field"] != "(none)":
-            rule["then_equals"] = {r["then_equals_field"]: r["then_equals_value"]}
+        then_required = [f for f in parse_list(r["then_required"] or "") if f]
+        if then_required:
+            rule["then_required"] = then_required
+        if r["then_equals_field"]:
+            rule["then_equals"] = {r["then_equals_field"]: r["then_equals_value"] or ""}
         rules.append(rule)
 
+    # frozensets: hashable for the cached wrappers, no duplicates to rescan
+    missing_labels = {
+        "na_values": frozenset(parse_list(na_values) + [None]),
+        "no_values": frozenset(parse_list(no_values)),
+        "unknown_values": frozenset(parse_list(unknown_values)),
+    }
+
     cfg = {
         "standardization": {
             "id_fields": {"entity_id": entity_id} if entity_id != "(none)" else {},
             "date_field": date_field if date_field != "(none)" else None,
-            "missing_labels": {
-                "na_values": parse_list(na_values) + [None],
-                "no_values": parse_list(no_values),
-                "unknown_values": parse_list(unknown_values),
-            },
+            "missing_labels": missing_labels,
+            # One value -> label table, so standardization is a single lookup pass
+            "missing_labels_map": build_label_map(missing_labels),
         },
         "checks": {
             "completeness": {
@@ -189,26 +282,39 @@ def build_cfg() -> dict:
     return cfg
 
 
-cfg = build_cfg()
-
 # ---------------------------
 # Run
 # ---------------------------
-run = st.button("▶ Run checks", type="primary")
-
-if not run:
+if not submitted:
     st.stop()
 
+# Nothing above the gate reads the config, so only build it for a run
+cfg = build_cfg()
+
 st.subheader("Results")
 
 # Apply standardization
-df_std = apply_missing_labels(df, cfg.get("standardization", {}))
-
-# Run checks
-comp = run_completeness(df_std, cfg["checks"]["completeness"])
-dups = run_duplicates(df_std, cfg["checks"]["duplicates"])
-cons = run_consistency(df_std, cfg["checks"]["consistency"])
-drift = run_drift(df_std, cfg["checks"]["drift"])
+upload_key = st.session_state["upload_key"]
+df_std = _std(df, upload_key, cfg.get("standardization", {}))
+std_key = (upload_key, cfg.get("standardization", {}))
+
+# Run checks (each on just the columns it reads, which also keeps cache hashing cheap)
+checks_cfg = cfg["checks"]
+jobs = {
+    "comp": (_comp, narrow(df_std, checks_cfg["completeness"]["required_fields"]), checks_cfg["completeness"]),
+    "dups": (_dups, narrow(df_std, checks_cfg["duplicates"]["keys"]), checks_cfg["duplicates"]),
+    "cons": (_cons, narrow(df_std, rule_fields(checks_cfg["consistency"])), checks_cfg["consistency"]),
+    "drift": (_drift, narrow(df_std, [checks_cfg["drift"]["date_field"]]), checks_cfg["drift"]),
+}
+# The checks are independent and mostly in pandas/numpy C code, so on
+# larger frames they run side by side like the CLI does
+if len(df_std) >= PARALLEL_MIN_ROWS:
+    with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+        futures = {k: ex.submit(fn, d, std_key, c) for k, (fn, d, c) in jobs.items()}
+    results = {k: f.result() for k, f in futures.items()}
+else:
+    results = {k: fn(d, std_key, c) for k, (fn, d, c) in jobs.items()}
+comp, dups, cons, drift = results["comp"], results["dups"], results["cons"], results["drift"]
 
 # Scorecard (minimal schema)
 scorecard_rows = [
@@ -219,7 +325,8 @@ scorecard_rows = [
 ]
 
 order = {"PASS": 0, "WARN": 1, "FAIL": 2}
-worst = max([comp.status, dups.status, cons.status, drift.status], key=lambda s: order.get(s, 2))
+worst_code = max(order.get(s, 2) for s in (comp.status, dups.status, cons.status, drift.status))
+worst = ("PASS", "WARN", "FAIL")[worst_code]
 scorecard_rows.append({"check": "overall", "status": worst, "notes": "Worst-of check statuses"})
 scorecard_df = pd.DataFrame(scorecard_rows)
 
@@ -238,44 +345,58 @@ else:
 if issues_all.empty:
     fix_list = pd.DataFrame(columns=["check", "field", "message", "count"])
 else:
+    # Hash-aggregate in Arrow over the per-check frames; message breaks ties
+    # like the old groupby order
+    fix_keys = ["check", "field", "message"]
+    merged = pa.concat_tables(
+        [pa.Table.from_pandas(r[fix_keys], preserve_index=False) for r in issues_list],
+        promote_options="default",
+    )
     fix_list = (
-        issues_all.groupby(["check", "field", "message"], dropna=False)
-        .size()
-        .reset_index(name="count")
-        .sort_values(["count", "check", "field"], ascending=[False, True, True])
+        merged.group_by(fix_keys).aggregate([([], "count_all")]).to_pandas()
+        .rename(columns={"count_all": "count"})[fix_keys + ["count"]]
+        .sort_values(["count", "check", "field", "message"], ascending=[False, True, True, True])
     )
 
-# Display
-a, b = st.columns([1, 2])
-with a:
-    st.markdown("### Scorecard")
-    st.dataframe(scorecard_df, use_container_width=True)
-with b:
-    st.markdown("### Fix list (ranked)")
-    st.dataframe(fix_list, use_container_width=True)
-
-st.markdown("### Issues (record-level)")
-st.dataframe(issues_all, use_container_width=True, height=420)
-
-# Downloads
-st.markdown("---")
-st.subheader("Download outputs")
-
-timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-outputs = {
-    "quality_scorecard.csv": to_csv_bytes(scorecard_df),
-    "fix_list.csv": to_csv_bytes(fix_list),
-    "issues_all.csv": to_csv_bytes(issues_all),
-}
-
-zip_bytes = build_zip(outputs)
-
-c1, c2, c3, c4 = st.columns(4)
-with c1:
-    st.download_button("Download scorecard.csv", data=outputs["quality_scorecard.csv"], file_name="quality_scorecard.csv")
-with c2:
-    st.download_button("Download fix_list.csv", data=outputs["fix_list.csv"], file_name="fix_list.csv")
-with c3:
-    st.download_button("Download issues_all.csv", data=outputs["issues_all.csv"], file_name="issues_all.csv")
-with c4:
-    st.download_button("Download outputs.zip", data=zip_bytes, file_name=f"impactproof_outputs_{timestamp}.zip")
\ No newline at end of file
+# Display + downloads
+# A fragment: the compress toggle and download clicks rerun only this view,
+# not the upload/standardize/check pipeline above
+@st.fragment
+def _results_view(
+    scorecard_df: pd.DataFrame, fix_list: pd.DataFrame, issues_all: pd.DataFrame, run_key: tuple
+) -> None:
+    a, b = st.columns([1, 2])
+    with a:
+        st.markdown("### Scorecard")
+        st.dataframe(scorecard_df, use_container_width=True)
+    with b:
+        st.markdown("### Fix list (ranked)")
+        st.dataframe(fix_list, use_container_width=True)
+
+    st.markdown("### Issues (record-level)")
+    # Only a preview goes to the browser; the full set is in the downloads
+    st.dataframe(issues_all.head(ISSUES_PREVIEW_ROWS), use_container_width=True, height=420)
+    if len(issues_all) > ISSUES_PREVIEW_ROWS:
+        st.caption(f"Showing {ISSUES_PREVIEW_ROWS} of {len(issues_all)} rows; full set in downloads")
+
+    # Downloads
+    st.markdown("---")
+    st.subheader("Download outputs")
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    compress = st.checkbox("Compress outputs", value=True, help="Untick for a faster, larger uncompressed ZIP.")
+    outputs, zip_bytes = _encode_outputs(scorecard_df, fix_list, issues_all, run_key, compress)
+
+    c1, c2, c3, c4 = st.columns(4)
+    with c1:
+        st.download_button("Download scorecard.csv", data=outputs["quality_scorecard.csv"], file_name="quality_scorecard.csv")
+    with c2:
+        st.download_button("Download fix_list.csv", data=outputs["fix_list.csv"], file_name="fix_list.csv")
+    with c3:
+        st.download_button("Download issues_all.csv", data=outputs["issues_all.csv"], file_name="issues_all.csv")
+    with c4:
+        st.download_button("Download outputs.zip", data=zip_bytes, file_name=f"impactproof_outputs_{timestamp}.zip")
+
+
+# Outputs follow from the upload and the full config
+_results_view(scorecard_df, fix_list, issues_all, (upload_key, cfg))